@@ -6,184 +6,243 @@ and consecutive references
 
 import os
 import re
-from pathlib import Path
+import mmap
 import csv
-from collections import defaultdict
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
-def find_all_refs(rst_dir):
-    """Find all :ref: instances and PascalCase words in RST files"""
-    # Dictionary to store results
-    refs_by_file = defaultdict(list)
+# Pattern for references
+# This pattern will match both :ref:`label` and :ref:`text<label>` formats
+# [^`] also matches line breaks, so multi-line references are found too
+REF_REGEX = rb':ref:`(?P<ref_text>[^`]+)`'
+
+# Pattern for PascalCase words (starts with capital letter, has at least one lowercase letter)
+# Excludes all-caps words like 'XML' or 'HTML'
+PASCAL_REGEX = rb'\b(?:[A-Z][a-z]+[A-Z][A-Za-z]*|[A-Z][a-z]*[A-Z][A-Za-z]*)\b'
+
+# Pattern for camelCase words (starts with lowercase letter, has at least one uppercase letter)
+CAMEL_REGEX = rb'\b[a-z]+[A-Z][A-Za-z]*\b'
+
+# PascalCase and camelCase words, told apart by match.lastgroup
+WORD_PATTERN = re.compile(rb'(?P<pascal>' + PASCAL_REGEX + rb')|(?P<camel>' + CAMEL_REGEX + rb')')
+
+# References and words in a single pass over the content, compiled once per process
+SCAN_PATTERN = re.compile(rb'(?P<ref>' + REF_REGEX + rb')|' + WORD_PATTERN.pattern, re.DOTALL)
+
+NEWLINE_PATTERN = re.compile(rb'\n')
+
+# How many examples of each kind main() prints
+EXAMPLE_LIMITS = {
+    'multi_line': 5,
+    'consecutive': 5,
+    'pascal': 10,
+    'camel': 10,
+}
+
+def _line_counter(content):
+    """Return a function mapping offsets in content to 1-based line numbers
+    
+    The newline offsets are indexed once per file, so each lookup is a binary
+    search instead of a count over everything before the match.
+    """
+    newlines = [match.start() for match in NEWLINE_PATTERN.finditer(content)]
+    
+    def line_at(offset):
+        return bisect_left(newlines, offset) + 1
+    
+    return line_at
+
+def _add_example(examples, kind, line_at, match, text):
+    """Record a match as an example of the given kind, up to EXAMPLE_LIMITS"""
+    if len(examples[kind]) < EXAMPLE_LIMITS[kind]:
+        examples[kind].append((line_at(match.start()), text))
+
+def _is_word_char(char_bytes):
+    """Check if the UTF-8 character at the start of char_bytes is a letter, digit or underscore"""
+    char = char_bytes.decode('utf-8', 'replace')[:1]
+    return char.isalnum() or char == '_'
+
+def _joins_non_ascii_word(content, start, end):
+    """Check if the word at content[start:end] continues into a non-ASCII letter or digit
+    
+    A bytes word boundary only knows ASCII word characters, so the 'ï' in
+    'naïveCase' looks like one. The neighbouring character is decoded and checked
+    the way a str pattern would, so punctuation like curly quotes still ends a word.
+    """
+    if start > 0 and content[start - 1] >= 0x80:
+        # Step back over UTF-8 continuation bytes to the start of the character
+        lead = start - 1
+        while lead > 0 and start - lead < 4 and 0x80 <= content[lead] < 0xC0:
+            lead -= 1
+        if _is_word_char(content[lead:start]):
+            return True
+    
+    if end < len(content) and content[end] >= 0x80:
+        if _is_word_char(content[end:end + 4]):
+            return True
+    
+    return False
+
+def _add_word(match, line_at, phrases, examples, counts):
+    """Add a PascalCase or camelCase word match to the results"""
+    if _joins_non_ascii_word(match.string, match.start(), match.end()):
+        return
+    
+    match_type = match.lastgroup
+    word = match.group(0).decode('ascii')
+    
+    phrases.add(word)
+    _add_example(examples, match_type, line_at, match, word)
+    counts[match_type] += 1
+
+def _char_gap(content, start, end):
+    """Count the characters, not UTF-8 bytes, between two offsets in content
+    
+    Only short gaps are decoded: 40 bytes hold at least 10 characters,
+    which is all the consecutive reference check needs to know.
+    """
+    gap = end - start
+    if gap < 10 or gap >= 40:
+        return gap
+    return len(content[start:end].decode('utf-8'))
+
+def _scan_content(content, phrases, examples, counts):
+    """Collect :ref: instances, PascalCase and camelCase words from a file's bytes
+    
+    All three are found in one pass of SCAN_PATTERN. A :ref: match consumes
+    the words inside it, so those are picked up by a scan bounded to its text.
+    Only the words and a few examples are kept, not every match.
+    """
+    line_at = _line_counter(content)
+    prev_ref_end = None
+    
+    for match in SCAN_PATTERN.finditer(content):
+        if match.lastgroup != 'ref':
+            _add_word(match, line_at, phrases, examples, counts)
+            continue
+        
+        counts['ref'] += 1
+        
+        # Determine if this is a multi-line reference
+        if b'\n' in match.group('ref_text'):
+            counts['multi_line'] += 1
+            _add_example(examples, 'multi_line', line_at, match,
+                         match.group('ref_text').decode('utf-8'))
+        
+        # Determine if this is part of consecutive references
+        # If less than 10 characters between references, consider them consecutive
+        if prev_ref_end is not None and _char_gap(content, prev_ref_end, match.start()) < 10:
+            counts['consecutive'] += 1
+            _add_example(examples, 'consecutive', line_at, match,
+                         match.group('ref_text').decode('utf-8'))
+        prev_ref_end = match.end()
+        
+        # Find the PascalCase and camelCase words inside the reference
+        for word_match in WORD_PATTERN.finditer(content, match.start('ref_text'), match.end('ref_text')):
+            _add_word(word_match, line_at, phrases, examples, counts)
+
+def _scan_file(rst_file):
+    """Scan a single RST file for :ref: instances, PascalCase and camelCase words
+    
+    Runs in a worker process, so everything it needs is passed in or module-level.
+    Returns a tuple of (filename, phrases, examples, counts, error).
+    """
+    phrases = set()
+    examples = defaultdict(list)
+    counts = Counter()
+    
+    try:
+        # Map the file instead of reading it so the regexes scan the page cache
+        # directly; the patterns are ASCII so only matches need decoding
+        with open(rst_file, 'rb') as f:
+            # An empty file can't be mapped, and has nothing to find anyway
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    _scan_content(content, phrases, examples, counts)
+    
+    except Exception as e:
+        # Skip the whole file, not just the rest of it
+        return str(rst_file), set(), {}, Counter(), e
     
-    # Regular expressions for finding references
-    # This pattern will match both :ref:`label` and :ref:`text<label>` formats
-    # Using re.DOTALL to match across line breaks
-    ref_pattern = re.compile(r':ref:`([^`]+)`', re.DOTALL)
+    return str(rst_file), phrases, examples, counts, None
+
+def _iter_rst_files(rst_dir):
+    """Yield the paths of all RST files below rst_dir
+    
+    Walks the tree with os.scandir, whose entries carry the file type from the
+    directory listing, so no extra stat or Path object is needed per entry.
+    """
+    # Like rglob, a missing directory simply has no files
+    if not os.path.isdir(rst_dir):
+        return
     
-    # Pattern for PascalCase words (starts with capital letter, has at least one lowercase letter)
-    # Excludes all-caps words like 'XML' or 'HTML'
-    pascal_pattern = re.compile(r'\b([A-Z][a-z]+[A-Z][A-Za-z]*|[A-Z][a-z]*[A-Z][A-Za-z]*)\b')
+    stack = [rst_dir]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.rst'):
+                    yield entry.path
+
+def find_all_refs(rst_dir):
+    """Find all :ref: instances and PascalCase words in RST files
     
-    # Pattern for camelCase words (starts with lowercase letter, has at least one uppercase letter)
-    camel_pattern = re.compile(r'\b([a-z]+[A-Z][A-Za-z]*)\b')
+    Returns a tuple of (phrases, examples): the set of unique PascalCase and
+    camelCase words found, and a dict of up to EXAMPLE_LIMITS (filename, line_num, text)
+    examples for each kind of match.
+    """
+    phrases = set()
+    examples = {kind: [] for kind in EXAMPLE_LIMITS}
     
     # Find all RST files
-    rst_files = list(Path(rst_dir).rglob("*.rst"))
+    rst_files = list(_iter_rst_files(rst_dir))
     print(f"Found {len(rst_files)} RST files to scan")
     
-    total_refs = 0
-    total_pascal = 0
-    total_camel = 0
-    multi_line_refs = 0
-    consecutive_refs = 0
-    
-    for rst_file in rst_files:
-        try:
-            # Read the entire file content
-            with open(rst_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-                # Find all :ref: instances in the file
-                ref_matches = list(ref_pattern.finditer(content))
-                
-                # Process each ref match
-                for i, match in enumerate(ref_matches):
-                    ref_text = match.group(1)
-                    
-                    # Determine if this is a multi-line reference
-                    is_multi_line = '\n' in ref_text
-                    if is_multi_line:
-                        multi_line_refs += 1
-                    
-                    # Determine if this is part of consecutive references
-                    is_consecutive = False
-                    if i > 0:
-                        prev_end = ref_matches[i-1].end()
-                        current_start = match.start()
-                        # If less than 10 characters between references, consider them consecutive
-                        if current_start - prev_end < 10:
-                            is_consecutive = True
-                            consecutive_refs += 1
-                    
-                    # Get the line number by counting newlines before the match
-                    line_num = content[:match.start()].count('\n') + 1
-                    
-                    # Get context (up to 100 chars before and after)
-                    start_context = max(0, match.start() - 100)
-                    end_context = min(len(content), match.end() + 100)
-                    context = content[start_context:end_context].replace('\n', ' ')
-                    
-                    # Add to our results with flags for multi-line and consecutive
-                    refs_by_file[str(rst_file)].append((
-                        line_num, 
-                        context, 
-                        ref_text,
-                        'ref',  # Type of match
-                        is_multi_line,
-                        is_consecutive
-                    ))
-                    total_refs += 1
-                    
-                # Find all PascalCase words
-                pascal_matches = list(pascal_pattern.finditer(content))
-                
-                # Process each PascalCase match
-                for match in pascal_matches:
-                    pascal_word = match.group(0)
-                    
-                    # Get the line number
-                    line_num = content[:match.start()].count('\n') + 1
-                    
-                    # Get context (up to 100 chars before and after)
-                    start_context = max(0, match.start() - 100)
-                    end_context = min(len(content), match.end() + 100)
-                    context = content[start_context:end_context].replace('\n', ' ')
-                    
-                    # Add to our results
-                    refs_by_file[str(rst_file)].append((
-                        line_num,
-                        context,
-                        pascal_word,
-                        'pascal',  # Type of match
-                        False,     # Not multi-line
-                        False      # Not consecutive
-                    ))
-                    total_pascal += 1
-                
-                # Find all camelCase words
-                camel_matches = list(camel_pattern.finditer(content))
-                
-                # Process each camelCase match
-                for match in camel_matches:
-                    camel_word = match.group(0)
-                    
-                    # Get the line number
-                    line_num = content[:match.start()].count('\n') + 1
-                    
-                    # Get context (up to 100 chars before and after)
-                    start_context = max(0, match.start() - 100)
-                    end_context = min(len(content), match.end() + 100)
-                    context = content[start_context:end_context].replace('\n', ' ')
-                    
-                    # Add to our results
-                    refs_by_file[str(rst_file)].append((
-                        line_num,
-                        context,
-                        camel_word,
-                        'camel',   # Type of match
-                        False,     # Not multi-line
-                        False      # Not consecutive
-                    ))
-                    total_camel += 1
-                        
-        except Exception as e:
-            print(f"Error processing {rst_file}: {e}")
-    
-    print(f"Found {total_refs} :ref: instances across {len(refs_by_file)} files")
-    print(f"Found {total_pascal} PascalCase words")
-    print(f"Found {total_camel} camelCase words")
-    print(f"Multi-line references: {multi_line_refs}")
-    print(f"Consecutive references: {consecutive_refs}")
-    return refs_by_file
-
-def clean_ref_text(text):
-    """Clean up reference text by removing linefeeds and extra spaces"""
-    # Replace linefeeds and multiple spaces with a single space
-    cleaned = re.sub(r'\s+', ' ', text)
-    # Trim leading/trailing whitespace
-    cleaned = cleaned.strip()
-    return cleaned
-
-def write_results_to_csv(refs_by_file, output_file):
-    """Write results to a CSV file in the format required for phrases.csv"""
-    # Create a set to store unique phrases (to avoid duplicates)
-    unique_phrases = set()
-    
-    # First collect all unique phrases
-    for filename, refs in refs_by_file.items():
-        for line_num, context, text, match_type, is_multi_line, is_consecutive in refs:
-            # Clean up the text
-            cleaned_text = clean_ref_text(text)
-            
-            # Only include PascalCase and camelCase words
-            if match_type in ['pascal', 'camel']:
-                unique_phrases.add(cleaned_text)
+    totals = Counter()
+    files_with_matches = 0
+    
+    # Scanning is CPU-bound regex work, so spread the files across processes
+    # to get around the GIL. The chunksize amortizes the pickling overhead.
+    with ProcessPoolExecutor() as executor:
+        for filename, file_phrases, file_examples, counts, error in executor.map(_scan_file, rst_files, chunksize=16):
+            if error is not None:
+                print(f"Error processing {filename}: {error}")
+            if counts:
+                files_with_matches += 1
+            phrases |= file_phrases
+            for kind, kind_examples in file_examples.items():
+                room = EXAMPLE_LIMITS[kind] - len(examples[kind])
+                examples[kind].extend((filename, line_num, text) for line_num, text in kind_examples[:room])
+            totals.update(counts)
     
+    print(f"Found {totals['ref']} :ref: instances across {files_with_matches} files")
+    print(f"Found {totals['pascal']} PascalCase words")
+    print(f"Found {totals['camel']} camelCase words")
+    print(f"Multi-line references: {totals['multi_line']}")
+    print(f"Consecutive references: {totals['consecutive']}")
+    return phrases, examples
+
+def write_results_to_csv(unique_phrases, output_file):
+    """Write results to a CSV file in the format required for phrases.csv"""
     # Now write to CSV in the required format
-    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+    # A large buffer lets the rows go out in a few big writes
+    with open(output_file, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(["EN", "SV", "PLURAL"])
         
-        # Write each unique phrase
-        for phrase in sorted(unique_phrases):
-            writer.writerow([
-                phrase,  # EN column
-                phrase,  # SV column (same as EN for now)
-                phrase   # PLURAL column (same as EN for now)
-            ])
+        # Write all unique phrases in one call; SV and PLURAL are the same as EN for now
+        writer.writerows((phrase, phrase, phrase) for phrase in sorted(unique_phrases))
     
     print(f"Results written to {output_file}")
 
+def print_examples(title, examples):
+    """Print examples as filename:line - text"""
+    print(f"\n{title}:")
+    for filename, line_num, text in examples:
+        print(f"{os.path.basename(filename)}:{line_num} - {text}")
+
 def main():
     # Paths
     rst_dir = "repos/koha-manual/source"
@@ -191,57 +250,25 @@ def main():
     
     # Find all :ref: instances
     print(f"Scanning RST files in {rst_dir}...")
-    refs_by_file = find_all_refs(rst_dir)
+    phrases, examples = find_all_refs(rst_dir)
     
     # Write results to CSV
-    write_results_to_csv(refs_by_file, output_file)
+    write_results_to_csv(phrases, output_file)
     
     # Also print some examples to the console
     print("\nExample :ref: instances:")
-    multi_line_examples = 0
-    consecutive_examples = 0
-    pascal_examples = 0
-    camel_examples = 0
     
     # First show some multi-line examples if they exist
-    print("\nMulti-line reference examples:")
-    for filename, refs in refs_by_file.items():
-        for line_num, context, text, match_type, is_multi_line, is_consecutive in refs:
-            if match_type == 'ref' and is_multi_line and multi_line_examples < 5:
-                print(f"{os.path.basename(filename)}:{line_num} - {text}")
-                multi_line_examples += 1
-        if multi_line_examples >= 5:
-            break
+    print_examples("Multi-line reference examples", examples['multi_line'])
     
     # Then show some consecutive reference examples
-    print("\nConsecutive reference examples:")
-    for filename, refs in refs_by_file.items():
-        for line_num, context, text, match_type, is_multi_line, is_consecutive in refs:
-            if match_type == 'ref' and is_consecutive and consecutive_examples < 5:
-                print(f"{os.path.basename(filename)}:{line_num} - {text}")
-                consecutive_examples += 1
-        if consecutive_examples >= 5:
-            break
-            
+    print_examples("Consecutive reference examples", examples['consecutive'])
+    
     # Show some PascalCase examples
-    print("\nPascalCase word examples:")
-    for filename, refs in refs_by_file.items():
-        for line_num, context, text, match_type, is_multi_line, is_consecutive in refs:
-            if match_type == 'pascal' and pascal_examples < 10:
-                print(f"{os.path.basename(filename)}:{line_num} - {text}")
-                pascal_examples += 1
-        if pascal_examples >= 10:
-            break
-            
+    print_examples("PascalCase word examples", examples['pascal'])
+    
     # Show some camelCase examples
-    print("\ncamelCase word examples:")
-    for filename, refs in refs_by_file.items():
-        for line_num, context, text, match_type, is_multi_line, is_consecutive in refs:
-            if match_type == 'camel' and camel_examples < 10:
-                print(f"{os.path.basename(filename)}:{line_num} - {text}")
-                camel_examples += 1
-        if camel_examples >= 10:
-            break
+    print_examples("camelCase word examples", examples['camel'])
     
     print(f"\nSee {output_file} for complete results")
 
@@ -9,8 +9,16 @@ import pytest
 # Add the project root to the path so we can import modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Add your fixtures here as needed
-# Example:
-# @pytest.fixture
-# def sample_data():
-#     return {"key": "value"}
+# Directory with the shared test fixture files
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+@pytest.fixture(scope="session")
+def sample_pot_path():
+    """Path to the sample.pot fixture file."""
+    return os.path.join(FIXTURES_DIR, "sample.pot")
+
+@pytest.fixture(scope="session")
+def sample_pot_content(sample_pot_path):
+    """Content of the sample.pot fixture file, read once per test session."""
+    with open(sample_pot_path, 'r', encoding='utf-8') as f:
+        return f.read()
@@ -0,0 +1,171 @@
+"""
+Unit tests for the find_auto_phrases module.
+"""
+import csv
+import pytest
+
+from find_auto_phrases import (
+    EXAMPLE_LIMITS,
+    find_all_refs,
+    write_results_to_csv
+)
+
+class TestFindAutoPhrases:
+    """Test cases for scanning RST files for references and phrases."""
+    
+    @pytest.fixture
+    def rst_dir(self, tmp_path):
+        """Create a temporary RST source tree for testing."""
+        source_dir = tmp_path / "source"
+        (source_dir / "sub").mkdir(parents=True)
+        
+        (source_dir / "intro.rst").write_text(
+            "Introduction\n"
+            "============\n"
+            "\n"
+            "See :ref:`the setup <setup-label>` and :ref:`more\n"
+            "text <other-label>` for the KohaAdmin and itemType values.\n",
+            encoding="utf-8"
+        )
+        (source_dir / "sub" / "circ.rst").write_text(
+            "Use the CheckOut module.\n",
+            encoding="utf-8"
+        )
+        (source_dir / "notes.txt").write_text("IgnoredWord\n", encoding="utf-8")
+        (source_dir / "empty.rst").write_text("", encoding="utf-8")
+        
+        return source_dir
+    
+    def test_find_all_refs_finds_refs(self, rst_dir, capsys):
+        """Test that :ref: instances are counted and flagged with line numbers."""
+        phrases, examples = find_all_refs(str(rst_dir))
+        
+        intro = str(rst_dir / "intro.rst")
+        
+        # Second reference spans two lines and follows the first closely
+        assert examples['multi_line'] == [(intro, 4, "more\ntext <other-label>")]
+        assert examples['consecutive'] == [(intro, 4, "more\ntext <other-label>")]
+        
+        output = capsys.readouterr().out
+        assert "Found 2 :ref: instances across 2 files" in output
+        assert "Multi-line references: 1" in output
+        assert "Consecutive references: 1" in output
+    
+    def test_find_all_refs_finds_words(self, rst_dir):
+        """Test that PascalCase and camelCase words are found in all RST files."""
+        phrases, examples = find_all_refs(str(rst_dir))
+        
+        assert phrases == {"CheckOut", "KohaAdmin", "itemType"}
+        assert (str(rst_dir / "intro.rst"), 5, "KohaAdmin") in examples['pascal']
+        assert (str(rst_dir / "sub" / "circ.rst"), 1, "CheckOut") in examples['pascal']
+        assert examples['camel'] == [(str(rst_dir / "intro.rst"), 5, "itemType")]
+        
+        # Only .rst files are scanned
+        assert "IgnoredWord" not in phrases
+    
+    def test_find_all_refs_finds_words_in_refs(self, tmp_path):
+        """Test that words inside a :ref: are found as well as the reference."""
+        (tmp_path / "refs.rst").write_text("See :ref:`KohaAdmin <admin>`.\n", encoding="utf-8")
+        
+        phrases, examples = find_all_refs(str(tmp_path))
+        
+        assert phrases == {"KohaAdmin"}
+    
+    def test_find_all_refs_keeps_accented_words_whole(self, tmp_path):
+        """Test that non-ASCII letters are part of words, not word boundaries."""
+        (tmp_path / "accents.rst").write_text(
+            "A naïveCase and éFooBar but also KohaÅdmin.\n",
+            encoding="utf-8"
+        )
+        
+        phrases, examples = find_all_refs(str(tmp_path))
+        
+        assert phrases == set()
+    
+    @pytest.mark.parametrize("text", [
+        "See \u201cKohaAdmin\u201d here.\n",
+        "The KohaAdmin\u2014the main account.\n",
+        "Set KohaAdmin\u00a0now.\n",
+        "Use the KohaAdmin\u2019s settings\u2026\n",
+        "See :ref:`\u201cKohaAdmin\u201d <admin>`.\n",
+    ])
+    def test_find_all_refs_finds_words_next_to_punctuation(self, tmp_path, text):
+        """Test that non-ASCII punctuation and spaces next to a word end it like ASCII ones."""
+        (tmp_path / "punctuation.rst").write_text(text, encoding="utf-8")
+        
+        phrases, examples = find_all_refs(str(tmp_path))
+        
+        assert phrases == {"KohaAdmin"}
+    
+    def test_find_all_refs_counts_gap_in_characters(self, tmp_path, capsys):
+        """Test that the gap between consecutive references is counted in characters, not bytes."""
+        # Nine characters, but sixteen bytes in UTF-8
+        (tmp_path / "gap.rst").write_text(
+            ":ref:`first` \u00e5\u00e4\u00f6\u00e5\u00e4\u00f6\u00e5 :ref:`second`\n",
+            encoding="utf-8"
+        )
+        
+        phrases, examples = find_all_refs(str(tmp_path))
+        
+        assert examples['consecutive'] == [(str(tmp_path / "gap.rst"), 1, "second")]
+        assert "Consecutive references: 1" in capsys.readouterr().out
+    
+    def test_find_all_refs_limits_examples(self, tmp_path):
+        """Test that only a limited number of examples are kept."""
+        (tmp_path / "many.rst").write_text("KohaAdmin\n" * 50, encoding="utf-8")
+        
+        phrases, examples = find_all_refs(str(tmp_path))
+        
+        assert phrases == {"KohaAdmin"}
+        assert len(examples['pascal']) == EXAMPLE_LIMITS['pascal']
+        assert [line_num for _, line_num, _ in examples['pascal']] == list(range(1, 11))
+    
+    def test_find_all_refs_skips_empty_file(self, rst_dir, capsys):
+        """Test that empty RST files are scanned without errors."""
+        find_all_refs(str(rst_dir))
+        
+        assert "Error processing" not in capsys.readouterr().out
+    
+    def test_find_all_refs_skips_failing_file(self, tmp_path, capsys):
+        """Test that nothing from a file that fails to scan is counted."""
+        (tmp_path / "bad.rst").write_bytes(b"KohaAdmin :ref:`bad\n\xff text <label>`\n")
+        
+        phrases, examples = find_all_refs(str(tmp_path))
+        
+        assert phrases == set()
+        assert all(not kind_examples for kind_examples in examples.values())
+        
+        output = capsys.readouterr().out
+        assert "Error processing" in output
+        assert "Found 0 :ref: instances across 0 files" in output
+        assert "Multi-line references: 0" in output
+    
+    def test_find_all_refs_empty_directory(self, tmp_path):
+        """Test that an empty directory yields no results."""
+        phrases, examples = find_all_refs(str(tmp_path))
+        
+        assert phrases == set()
+        assert all(not kind_examples for kind_examples in examples.values())
+    
+    def test_find_all_refs_nonexistent_directory(self, tmp_path):
+        """Test that a nonexistent directory yields no results."""
+        phrases, examples = find_all_refs(str(tmp_path / "nonexistent"))
+        
+        assert phrases == set()
+    
+    def test_write_results_to_csv(self, rst_dir, tmp_path):
+        """Test that the phrases are written sorted in the phrases.csv format."""
+        phrases, examples = find_all_refs(str(rst_dir))
+        output_file = tmp_path / "auto_phrases.csv"
+        
+        write_results_to_csv(phrases, str(output_file))
+        
+        with open(output_file, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.reader(f))
+        
+        assert rows[0] == ["EN", "SV", "PLURAL"]
+        assert rows[1:] == [
+            ["CheckOut", "CheckOut", "CheckOut"],
+            ["KohaAdmin", "KohaAdmin", "KohaAdmin"],
+            ["itemType", "itemType", "itemType"],
+        ]
@@ -79,6 +79,30 @@ class TestPotFileHandling:
         result = find_pot_file("test", repo_path=nonexistent_path)
         assert result is None
     
+    def test_find_pot_file_finds_new_files(self, mock_repo_path):
+        """Test that find_pot_file finds .pot files created after an earlier lookup."""
+        assert find_pot_file("new", repo_path=mock_repo_path) is None
+        
+        locale_path = mock_repo_path / "build" / "locale"
+        new_pot_file = locale_path / "new.pot"
+        new_pot_file.write_text("new content")
+        assert find_pot_file("new", repo_path=mock_repo_path) == str(new_pot_file)
+        
+        # Partial matches see new files as well
+        (locale_path / "brandnew_chapter.pot").write_text("chapter content")
+        result = find_pot_file("brandnew", repo_path=mock_repo_path)
+        assert result == str(locale_path / "brandnew_chapter.pot")
+    
+    def test_find_pot_file_with_subpath(self, mock_repo_path):
+        """Test that find_pot_file finds an exact match given a path below the locale directory."""
+        sub_dir = mock_repo_path / "build" / "locale" / "sub"
+        sub_dir.mkdir()
+        (sub_dir / "nested.pot").write_text("nested content")
+        
+        result = find_pot_file(os.path.join("sub", "nested"), repo_path=mock_repo_path)
+        expected_path = os.path.join(mock_repo_path, "build", "locale", "sub", "nested.pot")
+        assert result == expected_path
+    
     def test_find_all_pot_files(self, mock_repo_path):
         """Test that find_all_pot_files finds all .pot files with repo_path."""
         result = find_all_pot_files(repo_path=mock_repo_path)
@@ -107,6 +131,16 @@ class TestPotFileHandling:
             expected_path = os.path.join(str(custom_dir), file)
             assert expected_path in result
     
+    def test_find_all_pot_files_ignores_other_entries(self, mock_repo_path):
+        """Test that find_all_pot_files skips non-.pot files, hidden files and directories."""
+        locale_path = mock_repo_path / "build" / "locale"
+        (locale_path / "notes.txt").write_text("not a pot file")
+        (locale_path / ".hidden.pot").write_text("hidden content")
+        (locale_path / "subdir.pot").mkdir()
+        
+        result = find_all_pot_files(repo_path=mock_repo_path)
+        assert sorted(os.path.basename(f) for f in result) == ["installation.pot", "test1.pot", "test2.pot"]
+    
     def test_find_all_pot_files_empty_directory(self, tmp_path):
         """Test that find_all_pot_files returns an empty list for directories with no .pot files."""
         empty_locale_path = tmp_path / "build" / "locale"
@@ -128,20 +162,15 @@ class TestPotFileHandling:
         assert result is True
         
     @pytest.fixture
-    def real_pot_file_dir(self, tmp_path):
+    def real_pot_file_dir(self, tmp_path, sample_pot_path):
         """Create a temporary directory with a real .pot file."""
-        # Get the path to the fixtures directory
-        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        fixtures_dir = os.path.join(script_dir, "fixtures")
-        sample_pot = os.path.join(fixtures_dir, "sample.pot")
-        
         # Create a directory for the test
         test_dir = tmp_path / "real_pot_files"
         test_dir.mkdir()
         
         # Copy the sample.pot file to the test directory
         dest_file = test_dir / "sample.pot"
-        shutil.copy(sample_pot, dest_file)
+        shutil.copy(sample_pot_path, dest_file)
         
         return test_dir
     
@@ -153,7 +182,7 @@ class TestPotFileHandling:
         
         # Verify the file exists and has the expected content
         assert os.path.isfile(result)
-        with open(result, 'r') as f:
+        with open(result, 'r', encoding='utf-8') as f:
             content = f.read()
             assert "msgid \"Installation\"" in content
             assert "msgid \"Prerequisites\"" in content
@@ -7,16 +7,94 @@ from pathlib import Path
 # Add the parent directory to the path so we can import the translate module
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
+# Patterns used to extract msgid entries and their regex comments from .pot files
+BLOCK_SEPARATOR = re.compile(r'\n\n')
+MSGID_PATTERN = re.compile(r'msgid "(.*?)"')
+REGEX_SUCCESS_PATTERN = re.compile(r'# regex_success "(.*?)"')
+REGEX_FAIL_PATTERN = re.compile(r'# regex_fail "(.*?)"')
+
+# Expected translations for each msgid in sample.pot: (msgid, success, fail)
+TRANSLATION_CASES = [
+    ("Installation",
+     "Installation",
+     "installation"),
+    ("This chapter provides instructions for installing Koha.",
+     "Detta kapitel ger instruktioner för installation av Koha.",
+     "Detta kapitel ger instruktioner för att installera Koha."),
+    ("Prerequisites",
+     "Förutsättningar",
+     "Krav"),
+    ("The following prerequisites are required for installation:",
+     "Följande förutsättningar krävs för installation:",
+     "Följande krav krävs för installation"),
+    ("Linux operating system",
+     "Linux-operativsystem",
+     "Linux operativ system"),
+    ("Apache web server",
+     "Apache webbserver",
+     "Apache web server"),
+    ("MySQL or MariaDB database server",
+     "MySQL eller MariaDB databasserver",
+     "MySQL eller MariaDB databas server"),
+    ("Perl programming language",
+     "Programmeringsspråket Perl",
+     "Perl programmeringsspråk"),
+]
+
+def parse_msgid_with_regex(content):
+    """
+    Extract msgid entries with their associated regex patterns from .pot file content.
+    
+    Args:
+        content (str): Content of a .pot file
+        
+    Returns:
+        list: List of tuples (msgid, regex_success, regex_fail)
+    """
+    # Split the content into message blocks
+    blocks = BLOCK_SEPARATOR.split(content)
+    
+    results = []
+    for block in blocks:
+        # Skip header or empty blocks
+        if not block.strip() or block.startswith('#,') or 'msgid ""' in block and 'msgstr ""' in block and '"Project-Id-Version' in block:
+            continue
+        
+        # Extract msgid
+        msgid_match = MSGID_PATTERN.search(block)
+        if not msgid_match:
+            continue
+        
+        msgid = msgid_match.group(1)
+        
+        # Extract regex patterns
+        regex_success = None
+        regex_fail = None
+        
+        success_match = REGEX_SUCCESS_PATTERN.search(block)
+        if success_match:
+            regex_success = success_match.group(1)
+        
+        fail_match = REGEX_FAIL_PATTERN.search(block)
+        if fail_match:
+            regex_fail = fail_match.group(1)
+        
+        if msgid and (regex_success or regex_fail):
+            results.append((msgid, regex_success, regex_fail))
+    
+    return results
+
+@pytest.fixture(scope="module")
+def regex_by_msgid(sample_pot_content):
+    """Map each msgid in the sample .pot file to its (regex_success, regex_fail) pair."""
+    return {
+        msgid: (regex_success, regex_fail)
+        for msgid, regex_success, regex_fail in parse_msgid_with_regex(sample_pot_content)
+    }
+
 class TestPotRegexValidation:
     """Test cases for regex validation patterns in .pot files."""
     
-    @pytest.fixture
-    def sample_pot_path(self):
-        """Get the path to the sample.pot file."""
-        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        fixtures_dir = os.path.join(script_dir, "fixtures")
-        return os.path.join(fixtures_dir, "sample.pot")
-    
     def extract_msgid_with_regex(self, pot_file_path):
         """
         Extract msgid entries with their associated regex patterns from a .pot file.
@@ -27,41 +105,10 @@ class TestPotRegexValidation:
         Returns:
             list: List of tuples (msgid, regex_success, regex_fail)
         """
-        with open(pot_file_path, 'r') as f:
+        with open(pot_file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Split the content into message blocks
-        blocks = re.split(r'\n\n', content)
-        
-        results = []
-        for block in blocks:
-            # Skip header or empty blocks
-            if not block.strip() or block.startswith('#,') or 'msgid ""' in block and 'msgstr ""' in block and '"Project-Id-Version' in block:
-                continue
-            
-            # Extract msgid
-            msgid_match = re.search(r'msgid "(.*?)"', block)
-            if not msgid_match:
-                continue
-            
-            msgid = msgid_match.group(1)
-            
-            # Extract regex patterns
-            regex_success = None
-            regex_fail = None
-            
-            success_match = re.search(r'# regex_success "(.*?)"', block)
-            if success_match:
-                regex_success = success_match.group(1)
-            
-            fail_match = re.search(r'# regex_fail "(.*?)"', block)
-            if fail_match:
-                regex_fail = fail_match.group(1)
-            
-            if msgid and (regex_success or regex_fail):
-                results.append((msgid, regex_success, regex_fail))
-        
-        return results
+        return parse_msgid_with_regex(content)
     
     def test_extract_regex_patterns(self, sample_pot_path):
         """Test that regex patterns can be extracted from the .pot file."""
@@ -79,75 +126,27 @@ class TestPotRegexValidation:
                 assert regex_success == "^Förutsättningar$"
                 assert regex_fail == "^Krav$"
     
-    def test_validate_translations_with_regex(self, sample_pot_path):
+    @pytest.mark.parametrize("msgid,success_translation,fail_translation", TRANSLATION_CASES)
+    def test_validate_translations_with_regex(self, regex_by_msgid, msgid, success_translation, fail_translation):
         """Test that translations can be validated using the regex patterns."""
-        patterns = self.extract_msgid_with_regex(sample_pot_path)
+        regex_success, regex_fail = regex_by_msgid[msgid]
         
-        # Create a mapping of msgid to expected translations
-        translation_map = {
-            "Installation": {
-                "success": "Installation",
-                "fail": "installation"
-            },
-            "This chapter provides instructions for installing Koha.": {
-                "success": "Detta kapitel ger instruktioner för installation av Koha.",
-                "fail": "Detta kapitel ger instruktioner för att installera Koha."
-            },
-            "Prerequisites": {
-                "success": "Förutsättningar",
-                "fail": "Krav"
-            },
-            "The following prerequisites are required for installation:": {
-                "success": "Följande förutsättningar krävs för installation:",
-                "fail": "Följande krav krävs för installation"
-            },
-            "Linux operating system": {
-                "success": "Linux-operativsystem",
-                "fail": "Linux operativ system"
-            },
-            "Apache web server": {
-                "success": "Apache webbserver",
-                "fail": "Apache web server"
-            },
-            "MySQL or MariaDB database server": {
-                "success": "MySQL eller MariaDB databasserver",
-                "fail": "MySQL eller MariaDB databas server"
-            },
-            "Perl programming language": {
-                "success": "Programmeringsspråket Perl",
-                "fail": "Perl programmeringsspråk"
-            }
-        }
-        
-        # Test validation for each pattern
-        for msgid, regex_success, regex_fail in patterns:
-            if not regex_success or not regex_fail:
-                continue
-            
-            # Get the appropriate translations for this msgid
-            if msgid in translation_map:
-                success_translation = translation_map[msgid]["success"]
-                fail_translation = translation_map[msgid]["fail"]
-                
-                # Test success pattern
-                success_pattern = re.compile(regex_success)
-                assert success_pattern.match(success_translation) is not None, f"Success pattern '{regex_success}' failed to match '{success_translation}' for msgid '{msgid}'"
-                
-                # Test fail pattern
-                fail_pattern = re.compile(regex_fail)
-                assert fail_pattern.match(fail_translation) is not None, f"Fail pattern '{regex_fail}' failed to match '{fail_translation}' for msgid '{msgid}'"
-                
-                # Cross-check (success pattern should not match fail translation)
-                assert success_pattern.match(fail_translation) is None, f"Success pattern '{regex_success}' incorrectly matched '{fail_translation}' for msgid '{msgid}'"
+        # Test success pattern
+        success_pattern = re.compile(regex_success)
+        assert success_pattern.match(success_translation) is not None, f"Success pattern '{regex_success}' failed to match '{success_translation}' for msgid '{msgid}'"
+        
+        # Test fail pattern
+        fail_pattern = re.compile(regex_fail)
+        assert fail_pattern.match(fail_translation) is not None, f"Fail pattern '{regex_fail}' failed to match '{fail_translation}' for msgid '{msgid}'"
+        
+        # Cross-check (success pattern should not match fail translation)
+        assert success_pattern.match(fail_translation) is None, f"Success pattern '{regex_success}' incorrectly matched '{fail_translation}' for msgid '{msgid}'"
     
-    def test_all_entries_have_regex(self, sample_pot_path):
+    def test_all_entries_have_regex(self, sample_pot_path, sample_pot_content):
         """Test that all msgid entries in the sample have regex patterns."""
-        with open(sample_pot_path, 'r') as f:
-            content = f.read()
-        
         # Get all msgid entries (excluding the header)
         msgid_pattern = re.compile(r'msgid "((?!Project-Id-Version).+?)"')
-        msgids = msgid_pattern.findall(content)
+        msgids = msgid_pattern.findall(sample_pot_content)
         
         # Get all entries with regex patterns
         patterns = self.extract_msgid_with_regex(sample_pot_path)
@@ -57,6 +57,17 @@ class TestTranslateCache:
         # Clean up
         conn.close()
     
+    def test_init_cache_db_uses_wal(self, test_db_path):
+        """Test that the cache database uses write-ahead logging."""
+        conn = init_cache_db(test_db_path)
+        
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA journal_mode")
+        assert cursor.fetchone()[0] == 'wal'
+        
+        # Clean up
+        conn.close()
+    
     def test_get_cache_hash(self):
         """Test that cache hashes are generated correctly."""
         # Test that the same inputs produce the same hash
@@ -9,7 +9,6 @@ import sqlite3
 import hashlib
 import argparse
 import deepl
-import glob
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -52,6 +51,11 @@ def init_cache_db(db_path=None):
     conn = sqlite3.connect(str(db_path))
     cursor = conn.cursor()
     
+    # Use write-ahead logging so each commit doesn't force a full fsync
+    # of the database file; NORMAL is safe in WAL mode for a cache
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    
     # Create table if it doesn't exist
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS translations (
@@ -294,7 +298,7 @@ def list_all_cache_entries(conn=None):
     """)
     
     entries = []
-    for row in cursor.fetchall():
+    for row in cursor:
         entries.append({
             'id': row[0],
             'source_text': row[1],
@@ -338,7 +342,7 @@ def find_cache_translation(text, conn=None):
     """, (f"%{text}%", f"%{text}%"))
     
     entries = []
-    for row in cursor.fetchall():
+    for row in cursor:
         entries.append({
             'id': row[0],
             'source_text': row[1],
@@ -520,15 +524,31 @@ def find_pot_file(filename, pot_file_dir=None, repo_path=None):
     if os.path.isfile(pot_file):
         return pot_file
     
-    # If not found directly, try to find it using glob
-    pot_files = glob.glob(os.path.join(locale_path, f"*{filename}*.pot"))
-    
-    if pot_files:
-        # Return the first match
-        return pot_files[0]
+    # If not found directly, return the first file whose name contains it
+    for pot_file in _list_pot_files(locale_path):
+        if filename in os.path.basename(pot_file)[:-len('.pot')]:
+            return pot_file
     
     return None
 
+def _list_pot_files(locale_path):
+    """
+    List the .pot files in a directory.
+    
+    Args:
+        locale_path (str): Path to an existing directory containing .pot files.
+    
+    Returns:
+        list: A list of paths to all .pot files found.
+    """
+    # Skip hidden files as glob does. The scandir entries already know
+    # their name and type, so no extra stat per file
+    with os.scandir(locale_path) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.name.endswith('.pot') and not entry.name.startswith('.') and entry.is_file()
+        ]
+
 def find_all_pot_files(pot_file_dir=None, repo_path=None):
     """
     Find all .pot files in the specified directory.
@@ -550,9 +570,7 @@ def find_all_pot_files(pot_file_dir=None, repo_path=None):
         return []
     
     # Find all .pot files
-    pot_files = glob.glob(os.path.join(locale_path, "*.pot"))
-    
-    return pot_files
+    return _list_pot_files(locale_path)
 
 def process_pot_file(pot_file_path, target_lang="SV", source_lang="EN", disable_cache=False):
     """